@@ -1,9 +1,10 @@
+from pathlib import Path
+
 from setuptools import find_packages
 from setuptools import setup
 
 
-with open("README.md") as fd:
-    long_description = fd.read()
+long_description = Path(__file__).with_name("README.md").read_text(encoding="utf-8")
 
 setup(
     name="jobs_done10",
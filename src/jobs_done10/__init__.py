@@ -1,8 +1,8 @@
 def get_version_title():
-    import pkg_resources
+    from importlib import metadata
 
     try:
-        version = pkg_resources.get_distribution("jobs_done10").version
-    except pkg_resources.DistributionNotFound:
+        version = metadata.version("jobs_done10")
+    except metadata.PackageNotFoundError:
         version = "<N/A>"
     return f"jobs_done10 ver. {version}"
@@ -4,10 +4,18 @@ Module containing everything related to Jenkins in jobs_done10.
 This includes a generator, job publishers, constants and command line interface commands.
 """
 
+import os
 from collections import namedtuple
 from contextlib import suppress
+from subprocess import check_output
+from xml.etree import ElementTree
 
 from jobs_done10.common import AsList
+from jobs_done10.job_generator import JobGeneratorConfigurator
+from jobs_done10.jobs_done_job import JOBS_DONE_FILENAME
+from jobs_done10.jobs_done_job import JobsDoneJob
+from jobs_done10.repository import Repository
+from jobs_done10.xml_factory import XmlFactory
 
 
 #
@@ -37,8 +45,6 @@ class JenkinsXmlJobGenerator:
         self.repository = None
 
     def Reset(self):
-        from jobs_done10.xml_factory import XmlFactory
-
         self.xml = XmlFactory("project")
         self.xml["description"] = "<!-- Managed by Job's Done -->"
         self.xml["keepDependencies"] = xmls(False)
@@ -238,8 +244,6 @@ class JenkinsXmlJobGenerator:
         # Set all options --------------------------------------------------------------------------
         # Try to obtain a default target_dir based on repository name
         if "url" in git_options:
-            from jobs_done10.repository import Repository
-
             repository = Repository(url=git_options["url"])
             _Set("target_dir", "relativeTargetDir", default=repository.name)
         else:
@@ -737,8 +741,6 @@ class JenkinsJobPublisher:
         :param unicode output_directory:
              Target directory for outputting job .xmls
         """
-        import os
-
         for job in self.jobs.values():
             with open(os.path.join(output_directory, job.name), "w", encoding="utf-8") as f:
                 f.write(job.xml)
@@ -783,8 +785,6 @@ class JenkinsJobPublisher:
             This function was separated to make use of Memoize cacheing, avoiding multiple queries
             to the same jenkins job config.xml
         """
-        from xml.etree import ElementTree
-
         # Read config to see if this job is in the same branch
         config = jenkins_api.get_job_config(jenkins_job)
 
@@ -880,18 +880,12 @@ def GetJobsFromDirectory(directory="."):
 
         .. seealso:: GetJobsFromFile
     """
-    from jobs_done10.jobs_done_job import JOBS_DONE_FILENAME
-    from jobs_done10.repository import Repository
-    import os
-
-    from subprocess import check_output
-
     url = (
-        check_output("git config --local --get remote.origin.url", shell=True, cwd=directory)
+        check_output(["git", "config", "--local", "--get", "remote.origin.url"], cwd=directory)
         .strip()
         .decode("UTF-8")
     )
-    branches = check_output("git branch", shell=True, cwd=directory).strip().decode("UTF-8")
+    branches = check_output(["git", "branch"], cwd=directory).strip().decode("UTF-8")
     for branch in branches.splitlines():
         branch = branch.strip()
         if "*" in branch:  # Current branch
@@ -922,9 +916,6 @@ def GetJobsFromFile(repository, jobs_done_file_contents):
 
     :return set(JenkinsJob)
     """
-    from jobs_done10.job_generator import JobGeneratorConfigurator
-    from jobs_done10.jobs_done_job import JobsDoneJob
-
     jenkins_generator = JenkinsXmlJobGenerator()
 
     jobs = []
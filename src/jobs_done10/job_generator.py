@@ -1,3 +1,6 @@
+import functools
+
+
 class IJobGenerator:
     """
     Interface for job generators.
@@ -76,7 +79,7 @@ class JobGeneratorConfigurator:
                 continue  # Skip unset options
 
             # Find function name associated with the option being processed
-            generator_function_name = "Set" + option.title().replace("_", "")
+            generator_function_name = _GetGeneratorFunctionName(option)
 
             # Obtain and call that function with the option value
             try:
@@ -89,6 +92,19 @@ class JobGeneratorConfigurator:
         return generator
 
 
+@functools.lru_cache(maxsize=None)
+def _GetGeneratorFunctionName(option):
+    """
+    :param unicode option:
+        Name of a `JobsDoneJob` option.
+
+    :return unicode:
+        Name of the generator function that handles `option`.
+            e.g.: 'junit_patterns' -> 'SetJunitPatterns'
+    """
+    return "Set" + option.title().replace("_", "")
+
+
 class JobGeneratorAttributeError(AttributeError):
     """
     Raised when trying to access a generator function that is not implemented.
@@ -1,5 +1,15 @@
+import functools
+import re
+
 import yaml
 
+try:
+    from yaml import CBaseLoader as _YAMLLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import BaseLoader as _YAMLLoader
+
+from jobs_done10.common import AsList
+
 
 # Name of jobs_done file, repositories must contain this file in their root dir to be able to
 # create jobs.
@@ -194,6 +204,15 @@ class JobsDoneJob:
         }
     )
 
+    # Jobs are created for every matrix row, so avoid a __dict__ for each one of them.
+    __slots__ = ("matrix_row", "repository", *PARSEABLE_OPTIONS)
+
+    # Accepted types for each parseable option, always as a tuple so errors can't change them.
+    _PARSEABLE_OPTIONS_TYPES = {
+        option_name: tuple(AsList(option_types))
+        for option_name, option_types in PARSEABLE_OPTIONS.items()
+    }
+
     def __init__(self):
         """
         :ivar dict(unicode,unicode) matrix_row:
@@ -261,21 +280,38 @@ class JobsDoneJob:
         # Avoid errors with tabs at the end of file
         yaml_contents = yaml_contents.strip()
 
-        # Load yaml
-        jd_data = yaml.load(yaml_contents, Loader=yaml.loader.BaseLoader)
+        # Load yaml, no need to call the loader when there is nothing left to parse
+        jd_data = _LoadYAML(yaml_contents) if yaml_contents else None
         if not jd_data:
             raise ValueError("Could not parse anything from .yaml contents")
 
+        return cls.CreateFromDict(jd_data, repository)
+
+    @classmethod
+    def CreateFromDict(cls, jd_data, repository):
+        """
+        Creates JobsDoneJob's from the already loaded contents of a jobs_done file.
+
+        :param dict(unicode,object) jd_data:
+            Contents of a jobs_done file, as loaded from YAML: all values must be strings, lists or
+            dicts. This dict is not modified.
+
+        :param Repository repository:
+            Repository information for jobs created from `jd_data`
+
+        :return list(JobsDoneJob):
+            List of jobs created for parameters.
+
+        .. seealso:: CreateFromYAML
+        """
         # Search for unknown options and type errors
         for option_name, option_value in jd_data.items():
-            option_name = option_name.rsplit(":", 1)[-1]
-            if option_name not in JobsDoneJob.PARSEABLE_OPTIONS:
+            option_name = option_name.rpartition(":")[2]
+            expected_types = cls._PARSEABLE_OPTIONS_TYPES.get(option_name)
+            if expected_types is None:
                 raise UnknownJobsDoneFileOption(option_name)
 
             obtained_type = type(option_value)
-            from jobs_done10.common import AsList
-
-            expected_types = AsList(JobsDoneJob.PARSEABLE_OPTIONS[option_name])
             if obtained_type not in expected_types:
                 raise JobsDoneFileTypeError(
                     option_name, obtained_type, expected_types, option_value
@@ -290,7 +326,7 @@ class JobsDoneJob:
             for yaml_dict in cls._IterDicts(jd_data):
                 for key, _value in yaml_dict.items():
                     if ":" in key:
-                        conditions = key.split(":")[:-1]
+                        conditions, _option_name = cls._SplitConditions(key)
 
                         for row in matrix_rows:
                             if cls._MatchConditions(
@@ -300,7 +336,8 @@ class JobsDoneJob:
                         else:
                             raise UnmatchableConditionError(key)
 
-        import re
+        # Special replacement variables 'branch' and 'name' are the same for every matrix_row
+        repository_format_dict = {"branch": repository.branch, "name": repository.name}
 
         jobs_done_jobs = []
         for matrix_row in matrix_rows:
@@ -311,8 +348,7 @@ class JobsDoneJob:
 
             # Re-read jd_data replacing all matrix variables with their values in the current
             # matrix_row and special replacement variables 'branch' and 'name', based on repository.
-            format_dict = {"branch": repository.branch, "name": repository.name}
-            format_dict.update(matrix_row.simple_dict)
+            format_dict = {**repository_format_dict, **matrix_row.simple_dict}
             jd_formatted_data = cls._GetFormattedYAMLData(jd_data, format_dict)
             # Re-write formatted_data dict ignoring/replacing dict keys based on matrix
             for yaml_dict in cls._IterDicts(jd_formatted_data):
@@ -321,8 +357,7 @@ class JobsDoneJob:
                     if ":" not in key:
                         continue
 
-                    conditions = key.split(":")[:-1]
-                    option_name = key.split(":")[-1]
+                    conditions, option_name = cls._SplitConditions(key)
 
                     # Remove the key with condition text
                     del yaml_dict[key]
@@ -354,14 +389,48 @@ class JobsDoneJob:
                 continue
 
             # Do not create a job if there is no match for this branch
-            branch_patterns = jobs_done_job.branch_patterns or [".*"]
-            if not any([re.match(pattern, repository.branch) for pattern in branch_patterns]):
+            if not cls._MatchBranchPatterns(jobs_done_job.branch_patterns, repository.branch):
                 continue
 
             jobs_done_jobs.append(jobs_done_job)
 
         return jobs_done_jobs
 
+    @classmethod
+    def _SplitConditions(cls, key):
+        """
+        Splits a conditional option key into its conditions and option name.
+
+        e.g.:
+            'planet-earth:moon-europa:junit_patterns'
+            will return
+            (['planet-earth', 'moon-europa'], 'junit_patterns')
+
+        :param unicode key:
+            An option key containing at least one condition.
+
+        :return tuple(list(unicode),unicode):
+        """
+        conditions, _, option_name = key.rpartition(":")
+        return conditions.split(":"), option_name
+
+    @classmethod
+    def _MatchBranchPatterns(cls, branch_patterns, branch):
+        """
+        Check if a branch matches any of the given branch patterns.
+
+        :param list(unicode)|None branch_patterns:
+            Regexes matched against the branch name. Any branch matches if None or empty.
+
+        :param unicode branch:
+            Name of the branch.
+
+        :return boolean:
+        """
+        if not branch_patterns:
+            return True
+        return any(re.match(pattern, branch) for pattern in branch_patterns)
+
     @classmethod
     def _GetFormattedYAMLData(cls, yaml_data, format_dict):
         if isinstance(yaml_data, str):
@@ -477,8 +546,6 @@ class JobsDoneJob:
         :return boolean:
             Returns True if all the given conditions matches the given facts.
         """
-        import re
-
         # Assemble facts
         facts = {}
         for fact_dict in fact_dicts:
@@ -486,10 +553,10 @@ class JobsDoneJob:
         facts.update(extra_facts)
 
         def _Match(condition):
-            variable_name, match_mask = condition.split("-", 1)
+            variable_name, match_regex = _ParseCondition(condition)
             fact_values = facts[variable_name]
             return fact_values is cls._MATCH_ANY or any(
-                re.match(match_mask, fact) for fact in fact_values
+                match_regex.match(fact) for fact in fact_values
             )
 
         return all(map(_Match, conditions))
@@ -506,6 +573,8 @@ class JobsDoneJob:
             Maps names to the main value. .. seealso:: `full_dict`
         """
 
+        __slots__ = ("full_dict", "simple_dict")
+
         def __init__(self, names, values):
             """
             Create a matrix-row instance from a matrix-dict and a value tuple.
@@ -513,11 +582,11 @@ class JobsDoneJob:
             :param list(unicode) names:
                 List of variables names.
 
-            :param list(unicode) values:
-                List of values assumed by this row.
+            :param list(list(unicode)) values:
+                List of values assumed by this row, each one given as a list of aliases (the
+                first being the main value).
                 One value for each name in names parameter.
             """
-            values = tuple(i.split(",") for i in values)
             self.full_dict = dict(zip(names, values))
             self.simple_dict = {i: j[0] for (i, j) in self.full_dict.items()}
 
@@ -533,9 +602,12 @@ class JobsDoneJob:
             """
             import itertools as it
 
-            # Create all combinations of values available in the matrix
+            # Split aliases once for each value, instead of once for each row using that value
             names = list(matrix_dict.keys())
-            value_combinations = it.product(*list(matrix_dict.values()))
+            aliases = [[value.split(",") for value in values] for values in matrix_dict.values()]
+
+            # Create all combinations of values available in the matrix
+            value_combinations = it.product(*aliases)
             return [JobsDoneJob._MatrixRow(names, v) for v in value_combinations]
 
     @classmethod
@@ -632,6 +704,48 @@ class UnmatchableConditionError(ValueError):
         )
 
 
+@functools.lru_cache(maxsize=128)
+def _LoadYAML(yaml_contents):
+    """
+    Loads the contents of a jobs_done file.
+
+    Results are cached based on `yaml_contents`, since the same file is usually parsed many times
+    (once for every branch pushed to a repository, for instance).
+
+    :param unicode yaml_contents:
+        Contents of a jobs_done file, in YAML format.
+
+    :return object:
+        Loaded data. This object is shared between calls and must not be modified.
+    """
+    try:
+        return yaml.load(yaml_contents, Loader=_YAMLLoader)
+    except yaml.YAMLError:
+        if _YAMLLoader is yaml.BaseLoader:
+            raise
+
+    # Errors from libyaml lack the offending line and character, which users need to fix their
+    # files: parse again with the pure-Python loader to raise its more detailed error instead.
+    return yaml.load(yaml_contents, Loader=yaml.BaseLoader)
+
+
+@functools.lru_cache(maxsize=128)
+def _ParseCondition(condition):
+    """
+    Splits a condition in the form 'name-value' and compiles its value as a regex.
+
+    Cached because the same conditions are checked against every matrix row.
+
+    :param unicode condition:
+        A condition in the form 'name-value'.
+
+    :return tuple(unicode,re.Pattern):
+        The variable name and the compiled regex for its value.
+    """
+    variable_name, match_mask = condition.split("-", 1)
+    return variable_name, re.compile(match_mask)
+
+
 _TRUE_VALUES = ["TRUE", "YES", "1"]
 _FALSE_VALUES = ["FALSE", "NO", "0"]
 _TRUE_FALSE_VALUES = _TRUE_VALUES + _FALSE_VALUES
@@ -1,9 +1,10 @@
+import functools
 import re
 
 import attr
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class Repository:
     """
     Represents a source control repository used in a continuous integration job.
@@ -23,4 +24,14 @@ class Repository:
             url = 'https://server/repo.git'
             name = 'repo'
         """
-        return re.match(r".*/([^\./]+)(\.git/?)?$", self.url).groups()[0]
+        return _GetNameFromURL(self.url)
+
+
+@functools.lru_cache(maxsize=128)
+def _GetNameFromURL(url):
+    """
+    Cached because `Repository.name` is queried for every job generated for a repository.
+
+    .. seealso:: Repository.name
+    """
+    return re.match(r".*/([^\./]+)(\.git/?)?$", url).groups()[0]
@@ -1,4 +1,5 @@
 from xml.etree import ElementTree
+from xml.sax.saxutils import escape
 
 
 def WritePrettyXML(input, output):
@@ -14,7 +15,7 @@ def WritePrettyXML(input, output):
         The output filename or file opened for writing.
     """
     if isinstance(output, str):
-        out_stream = file(output, "w")
+        out_stream = open(output, "w", encoding="utf-8")
         close_output = True
     else:
         out_stream = output
@@ -41,14 +42,13 @@ def WritePrettyXMLElement(oss, element, indent=0):
         The level of indentation to write the tag.
         This is used internally for pretty printing.
     """
-    from xml.sax.saxutils import escape
+    indentation = "  " * indent
 
-    INDENT = "  "
-
-    # Start tag
-    oss.write(INDENT * indent + "<%s" % element.tag)
-    for i_name, i_value in sorted(element.attrib.items()):
-        oss.write(' {}="{}"'.format(i_name, escape(i_value)))
+    # Start tag, along with all its attributes
+    attrs = "".join(
+        f' {i_name}="{escape(i_value)}"' for i_name, i_value in sorted(element.attrib.items())
+    )
+    oss.write(f"{indentation}<{element.tag}{attrs}")
 
     if len(element) == 0 and element.text is None:
         oss.write("/>")
@@ -68,5 +68,5 @@ def WritePrettyXMLElement(oss, element, indent=0):
 
     # End tag
     if element.text is None:
-        oss.write("\n" + INDENT * indent)
+        oss.write("\n" + indentation)
     oss.write("</%s>" % element.tag)
@@ -17,6 +17,33 @@ from jobs_done10.jobs_done_job import JobsDoneFileTypeError
 from jobs_done10.jobs_done_job import JobsDoneJob
 from jobs_done10.repository import Repository
 
+_FAKE_REPOSITORY = Repository(url="http://fake.git", branch="not_master")
+
+# Lists of commands (in YAML) accepted by the build commands options, by case name
+_BUILD_COMMANDS_CASES = {
+    # works with a single command
+    "single": dedent(
+        """\
+        - my_command
+        """
+    ),
+    # Works with multi line commands
+    "multi": dedent(
+        """\
+        - |
+          multi_line
+          command
+        """
+    ),
+    # Works with multiple commands
+    "multi-commands": dedent(
+        """\
+        - command_1
+        - command_2
+        """
+    ),
+}
+
 
 class TestJenkinsXmlJobGenerator:
     # ===============================================================================================
@@ -125,83 +152,67 @@ class TestJenkinsXmlJobGenerator:
     def testJUnitPatterns(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 junit_patterns:
                 - "junit*.xml"
                 - "others.xml"
-                """
-            ),
+                """,
             boundary_tags=("publishers", "buildWrappers"),
         )
 
     def testTimeoutAbsolute(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 timeout: 60
-                """
-            ),
+                """,
             boundary_tags="buildWrappers",
         )
 
     def testTimeoutNoActivity(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 timeout_no_activity: 600
-                """
-            ),
+                """,
             boundary_tags="buildWrappers",
         )
 
     def testCustomWorkspace(self, file_regression):
-        (
-            self.Check(
-                file_regression,
-                yaml_contents=dedent(
-                    """
+        self.Check(
+            file_regression,
+            yaml_contents="""
                 custom_workspace: workspace/WS
-                """
-                ),
-                boundary_tags="project",
-            ),
+                """,
+            boundary_tags="project",
         )
 
     def testAuthToken(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 auth_token: my_token
-                """
-            ),
+                """,
             boundary_tags="project",
         )
 
     def testBoosttestPatterns(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 boosttest_patterns:
                 - "boost*.xml"
-                """
-            ),
+                """,
             boundary_tags=("publishers", "buildWrappers"),
         )
 
     def testJSUnitPatterns(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 jsunit_patterns:
                 - "jsunit*.xml"
-                """
-            ),
+                """,
             boundary_tags=("publishers", "buildWrappers"),
         )
 
@@ -232,14 +243,12 @@ class TestJenkinsXmlJobGenerator:
         # sanity: no ref
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                f"""
+            yaml_contents=f"""
                 branch-foo:{job_done_key}:
                 - someone else command
                 {job_done_key}:
                 - my_command
-                """
-            ),
+                """,
             boundary_tags="builders",
             basename=f"testBuildCommandsExpandNestedLists-noref-{xml_key}",
         )
@@ -247,15 +256,13 @@ class TestJenkinsXmlJobGenerator:
         # expand refs (after)
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                f"""
+            yaml_contents=f"""
                 branch-foo:{job_done_key}: &ref_a
                 - someone else command
                 {job_done_key}:
                 - my_command
                 - *ref_a
-                """
-            ),
+                """,
             boundary_tags="builders",
             basename=f"testBuildCommandsExpandNestedLists-expand-refs-after-{xml_key}",
         )
@@ -263,151 +270,73 @@ class TestJenkinsXmlJobGenerator:
         # expand refs (before)
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                f"""
+            yaml_contents=f"""
                 branch-foo:{job_done_key}: &ref_a
                 - someone else command
                 {job_done_key}:
                 - *ref_a
                 - my_command
-                """
-            ),
+                """,
             boundary_tags="builders",
             basename=f"testBuildCommandsExpandNestedLists-expand-refs-before-{xml_key}",
         )
 
-    def testBuildBatchCommand(self, file_regression):
-        # works with a single command
-        self.Check(
-            file_regression,
-            yaml_contents=dedent(
-                """
-                build_batch_commands:
-                - my_command
-                """
-            ),
-            boundary_tags="builders",
-            basename="testBuildBatchCommand-single",
-        )
-
-        # Works with multi line commands
+    @pytest.mark.parametrize("case", _BUILD_COMMANDS_CASES)
+    def testBuildBatchCommand(self, file_regression, case):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
-                build_batch_commands:
-                - |
-                  multi_line
-                  command
-                """
-            ),
+            yaml_contents="build_batch_commands:\n" + _BUILD_COMMANDS_CASES[case],
             boundary_tags="builders",
-            basename="testBuildBatchCommand-multi",
-        )
-
-        # Works with multiple commands
-        self.Check(
-            file_regression,
-            yaml_contents=dedent(
-                """
-                build_batch_commands:
-                - command_1
-                - command_2
-                """
-            ),
-            boundary_tags="builders",
-            basename="testBuildBatchCommand-multi-commands",
+            basename=f"testBuildBatchCommand-{case}",
         )
 
     def testBuildPythonCommand(self, file_regression):
         # works with a single command
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 build_python_commands:
                 - print 'hello'
-                """
-            ),
-            boundary_tags="builders",
-        )
-
-    def testBuildShellCommand(self, file_regression):
-        # works with a single command
-        self.Check(
-            file_regression,
-            yaml_contents=dedent(
-                """
-                build_shell_commands:
-                - my_command
-                """
-            ),
+                """,
             boundary_tags="builders",
-            basename="testBuildShellCommand-single",
         )
 
-        # Works with multi line commands
+    @pytest.mark.parametrize("case", _BUILD_COMMANDS_CASES)
+    def testBuildShellCommand(self, file_regression, case):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
-                build_shell_commands:
-                - |
-                  multi_line
-                  command
-                """
-            ),
+            yaml_contents="build_shell_commands:\n" + _BUILD_COMMANDS_CASES[case],
             boundary_tags="builders",
-            basename="testBuildShellCommand-multi",
-        )
-
-        # Works with multiple commands
-        self.Check(
-            file_regression,
-            yaml_contents=dedent(
-                """
-                build_shell_commands:
-                - command_1
-                - command_2
-                """
-            ),
-            boundary_tags="builders",
-            basename="testBuildShellCommand-multi-commands",
+            basename=f"testBuildShellCommand-{case}",
         )
 
     def testDescriptionRegex(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                r"""
+            yaml_contents=r"""
                 description_regex: "JENKINS DESCRIPTION\\: (.*)"
-                """
-            ),
+                """,
             boundary_tags="publishers",
         )
 
     def testNotifyStash(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                r"""
+            yaml_contents=r"""
                 notify_stash:
                   url: stash.com
                   username: user
                   password: pass
-                """
-            ),
+                """,
             boundary_tags="publishers",
         )
 
     def testNotifyGitHub(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                r"""
+            yaml_contents=r"""
                 notify_github:
-                """
-            ),
+                """,
             boundary_tags="publishers",
         )
 
@@ -417,11 +346,9 @@ class TestJenkinsXmlJobGenerator:
         """
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 notify_stash: stash.com
-                """
-            ),
+                """,
             boundary_tags="publishers",
         )
 
@@ -433,8 +360,7 @@ class TestJenkinsXmlJobGenerator:
         """
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 notify_stash:
                   url: stash.com
                   username: user
@@ -442,8 +368,7 @@ class TestJenkinsXmlJobGenerator:
 
                 jsunit_patterns:
                 - "jsunit*.xml"
-                """
-            ),
+                """,
             boundary_tags=("publishers", "buildWrappers"),
         )
 
@@ -465,10 +390,9 @@ class TestJenkinsXmlJobGenerator:
                 - europa
             """
         )
-        repository = Repository(url="http://fake.git", branch="not_master")
 
         # This test should create two jobs based on the given matrix
-        jobs_done_jobs = JobsDoneJob.CreateFromYAML(yaml_contents, repository)
+        jobs_done_jobs = JobsDoneJob.CreateFromYAML(yaml_contents, _FAKE_REPOSITORY)
 
         job_generator = JenkinsXmlJobGenerator()
 
@@ -495,10 +419,9 @@ class TestJenkinsXmlJobGenerator:
                 - europa
             """
         )
-        repository = Repository(url="http://fake.git", branch="not_master")
 
         # This test should create two jobs based on the given matrix
-        jd_file = JobsDoneJob.CreateFromYAML(yaml_contents, repository)[0]
+        jd_file = JobsDoneJob.CreateFromYAML(yaml_contents, _FAKE_REPOSITORY)[0]
         job_generator = JenkinsXmlJobGenerator()
 
         JobGeneratorConfigurator.Configure(job_generator, jd_file)
@@ -514,62 +437,52 @@ class TestJenkinsXmlJobGenerator:
     def testDisplayName(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 display_name: "{name}-{branch}"
-                """
-            ),
+                """,
             boundary_tags="project",
         )
 
     def testLabelExpression(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 label_expression: "win32&&dist-12.0"
-                """
-            ),
+                """,
             boundary_tags="project",
         )
 
     def testCron(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 cron: |
                        # Everyday at 22 pm
                        0 22 * * *
-                """
-            ),
+                """,
             boundary_tags="triggers",
         )
 
     def testSCMPoll(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 scm_poll: |
                        # Everyday at 22 pm
                        0 22 * * *
-                """
-            ),
+                """,
             boundary_tags="triggers",
         )
 
     def testAdditionalRepositories(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 additional_repositories:
                 - git:
                     url: http://some_url.git
                     branch: my_branch
-                """
-            ),
+                """,
             boundary_tags="scm",
         )
 
@@ -580,8 +493,7 @@ class TestJenkinsXmlJobGenerator:
         # Test git -> additional
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 git:
                   branch: custom_main
 
@@ -589,16 +501,14 @@ class TestJenkinsXmlJobGenerator:
                 - git:
                     url: http://additional.git
                     branch: custom_additional
-                """
-            ),
+                """,
             boundary_tags="scm",
         )
 
         # Test additional -> git
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 additional_repositories:
                 - git:
                     url: http://additional.git
@@ -606,8 +516,7 @@ class TestJenkinsXmlJobGenerator:
 
                 git:
                   branch: custom_main
-                """
-            ),
+                """,
             boundary_tags="scm",
         )
 
@@ -626,8 +535,7 @@ class TestJenkinsXmlJobGenerator:
     def testGitOptions(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 git:
                   recursive_submodules: true
                   reference: "/home/reference.git"
@@ -636,8 +544,7 @@ class TestJenkinsXmlJobGenerator:
                   clean_checkout: false
                   tags: true
                   lfs: true
-                """
-            ),
+                """,
             boundary_tags="scm",
         )
 
@@ -645,8 +552,7 @@ class TestJenkinsXmlJobGenerator:
     def testGitLFS(self, file_regression, enabled: str):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                f"""
+            yaml_contents=f"""
                 git:
                   branch: custom_main
                   lfs: false
@@ -656,34 +562,29 @@ class TestJenkinsXmlJobGenerator:
                     url: http://additional.git
                     branch: custom_additional
                     lfs: {enabled}
-                """
-            ),
+                """,
             boundary_tags="scm",
         )
 
     def testEmailNotificationDict(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 email_notification:
                   recipients: user@company.com other@company.com
                   notify_every_build: true
                   notify_individuals: true
 
-                """
-            ),
+                """,
             boundary_tags="publishers",
         )
 
     def testEmailNotificationString(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 email_notification: user@company.com other@company.com
-                """
-            ),
+                """,
             boundary_tags="publishers",
         )
 
@@ -695,8 +596,7 @@ class TestJenkinsXmlJobGenerator:
         """
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 email_notification:
                   recipients: user@company.com other@company.com
                   notify_every_build: true
@@ -704,37 +604,32 @@ class TestJenkinsXmlJobGenerator:
 
                 jsunit_patterns:
                 - "jsunit*.xml"
-                """
-            ),
+                """,
             boundary_tags=("publishers", "buildWrappers"),
         )
 
     def testNotification(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 notification:
                   protocol: ALPHA
                   format: BRAVO
                   url: https://bravo
-                """
-            ),
+                """,
             boundary_tags="properties",
         )
 
     def testSlack(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 slack:
                   team: esss
                   room: zulu
                   token: ALPHA
                   url: https://bravo
-                """
-            ),
+                """,
             boundary_tags=("properties", "publishers"),
         )
 
@@ -749,11 +644,9 @@ class TestJenkinsXmlJobGenerator:
     def testAnsiColor(self, conf_value, expected_name, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                f"""
+            yaml_contents=f"""
                 console_color: {conf_value}
-                """
-            ),
+                """,
             boundary_tags="buildWrappers",
             basename=f"testAnsiColor-{conf_value}-{expected_name}",
         )
@@ -761,11 +654,9 @@ class TestJenkinsXmlJobGenerator:
     def testTimestamps(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 timestamps:
-                """
-            ),
+                """,
             boundary_tags="buildWrappers",
         )
 
@@ -773,15 +664,13 @@ class TestJenkinsXmlJobGenerator:
     def testTriggerJobNoParameters(self, condition, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                f"""
+            yaml_contents=f"""
                 trigger_jobs:
                   names:
                     - etk-master-linux64-27
                     - etk-master-linux64-36
                   condition: {condition}
-                """
-            ),
+                """,
             boundary_tags="publishers",
             basename=f"testTriggerJobNoParameters-{condition}",
         )
@@ -806,8 +695,7 @@ class TestJenkinsXmlJobGenerator:
     def testTriggerJobParameters(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 trigger_jobs:
                   names:
                     - etk-master-linux64-27
@@ -815,8 +703,7 @@ class TestJenkinsXmlJobGenerator:
                   parameters:
                     - KEY1=VALUE1
                     - KEY2=VALUE2
-                """
-            ),
+                """,
             boundary_tags="publishers",
         )
 
@@ -922,8 +809,7 @@ class TestJenkinsXmlJobGenerator:
     def testWarnings(self, file_regression):
         self.Check(
             file_regression,
-            yaml_contents=dedent(
-                """
+            yaml_contents="""
                 warnings:
                   console:
                     - parser: Clang (LLVM based)
@@ -933,8 +819,7 @@ class TestJenkinsXmlJobGenerator:
                       file_pattern: "*.cpplint"
                     - parser: CodeAnalysis
                       file_pattern: "*.codeanalysis"
-                """
-            ),
+                """,
             boundary_tags="publishers",
         )
 
@@ -960,8 +845,7 @@ class TestJenkinsXmlJobGenerator:
             )
 
     def _GenerateJob(self, yaml_contents):
-        repository = Repository(url="http://fake.git", branch="not_master")
-        jobs_done_jobs = JobsDoneJob.CreateFromYAML(yaml_contents, repository)
+        jobs_done_jobs = JobsDoneJob.CreateFromYAML(yaml_contents, _FAKE_REPOSITORY)
 
         job_generator = JenkinsXmlJobGenerator()
         JobGeneratorConfigurator.Configure(job_generator, jobs_done_jobs[0])
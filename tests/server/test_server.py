@@ -6,11 +6,11 @@ from base64 import b64encode
 from collections.abc import Iterator
 from contextlib import contextmanager
 from http import HTTPStatus
+from importlib import metadata
 from pathlib import Path
 from textwrap import dedent
 from typing import Any
 
-import pkg_resources
 import pytest
 import requests_mock
 from flask.testing import FlaskClient
@@ -273,7 +273,7 @@ def test_github_post_signature_failed(
 
 @pytest.mark.parametrize("endpoint", ["/", "/stash", "/github"])
 def test_version(client: FlaskClient, endpoint: str) -> None:
-    version = pkg_resources.get_distribution("jobs_done10").version
+    version = metadata.version("jobs_done10")
     response = client.get(endpoint)
     expected = f"jobs_done10 ver. {version}"
     assert response.data.decode("UTF-8") == expected
@@ -1,4 +1,5 @@
 import contextlib
+import functools
 
 import pytest
 
@@ -50,8 +51,6 @@ def ExpectedCalls(obj, **function_expected_calls):
     calls = {}
 
     def _GetWrapper(hash_, original_function):
-        import functools
-
         @functools.wraps(original_function)
         def Wrapped(*args, **kwargs):
             calls[hash_][0] += 1
@@ -75,7 +74,7 @@ def ExpectedCalls(obj, **function_expected_calls):
 
     # __exit__
     try:
-        for (_, function_name), (obtained, expected, _) in list(calls.items()):
+        for (_, function_name), (obtained, expected, _) in calls.items():
             assert obtained == expected, 'Expected "%d" calls for function "%s", but got "%d"' % (
                 expected,
                 function_name,
@@ -83,5 +82,5 @@ def ExpectedCalls(obj, **function_expected_calls):
             )
     finally:
         # Clear all mocks
-        for (obj, function_name), (_, _, original_function) in list(calls.items()):
+        for (obj, function_name), (_, _, original_function) in calls.items():
             setattr(obj, function_name, original_function)
@@ -1,6 +1,7 @@
 from textwrap import dedent
 
 import pytest
+import yaml
 
 from jobs_done10.jobs_done_job import JobsDoneFileTypeError
 from jobs_done10.jobs_done_job import JobsDoneJob
@@ -11,6 +12,59 @@ from jobs_done10.repository import Repository
 
 _REPOSITORY = Repository(url="https://space.git", branch="milky_way")
 
+_PLANET_MOON_MATRIX = dedent(
+    """
+    matrix:
+      planet:
+      - mercury
+      - venus
+
+      moon:
+      - europa
+      - ganymede
+    """
+)
+
+_PLATFORM_SLAVE_MATRIX = dedent(
+    """
+    matrix:
+        platform:
+        - linux
+        - windows
+
+        slave:
+        - slave1
+        - slave2
+    """
+)
+
+_PLATFORM_MATRIX = dedent(
+    """
+    matrix:
+        platform:
+        - linux
+        - windows
+    """
+)
+
+_EARTH_MATRIX = dedent(
+    """
+    matrix:
+        planet:
+        - earth
+    """
+)
+
+_PLANETS_MATRIX = dedent(
+    """
+    matrix:
+        planet:
+        - mars
+        - earth
+        - venus
+    """
+)
+
 
 def testCreateJobsDoneJobFromYAML():
     yaml_contents = dedent(
@@ -106,22 +160,29 @@ def testCreateJobsDoneJobFromYAML():
     assert venus_job.label_expression == "planet-venus&&moon-europa"
 
 
+def testCreateFromDict():
+    jd_data = {
+        "platform-windows:build_batch_commands": ["{platform} command"],
+        "platform-linux:build_shell_commands": ["{platform} command on {branch}"],
+        "matrix": {"platform": ["linux", "windows"]},
+    }
+    linux_job, windows_job = JobsDoneJob.CreateFromDict(jd_data, repository=_REPOSITORY)
+
+    assert linux_job.matrix_row == {"platform": "linux"}
+    assert linux_job.build_shell_commands == ["linux command on milky_way"]
+    assert linux_job.build_batch_commands is None
+    assert windows_job.matrix_row == {"platform": "windows"}
+    assert windows_job.build_batch_commands == ["windows command"]
+    assert windows_job.build_shell_commands is None
+
+    # Received data is left untouched
+    assert "platform-windows:build_batch_commands" in jd_data
+
+
 def testExclude():
     key = lambda job: ":".join(j + "-" + job.matrix_row[j] for j in sorted(job.matrix_row.keys()))
     # Base case ------------------------------------------------------------------------------------
-    yaml_contents = dedent(
-        """
-        matrix:
-          planet:
-          - mercury
-          - venus
-
-          moon:
-          - europa
-          - ganymede
-
-        """
-    )
+    yaml_contents = _PLANET_MOON_MATRIX
     jobs_done_jobs = JobsDoneJob.CreateFromYAML(yaml_contents, repository=_REPOSITORY)
     assert sorted(map(key, jobs_done_jobs)) == [
         "moon-europa:planet-mercury",
@@ -131,17 +192,8 @@ def testExclude():
     ]
 
     # Exclude everything matching planet-venus -----------------------------------------------------
-    yaml_contents = dedent(
+    yaml_contents = _PLANET_MOON_MATRIX + dedent(
         """
-        matrix:
-          planet:
-          - mercury
-          - venus
-
-          moon:
-          - europa
-          - ganymede
-
         planet-venus:exclude: yes
         """
     )
@@ -152,17 +204,8 @@ def testExclude():
     ]
 
     # Exclude everything matching planet-venus and moon europa -------------------------------------
-    yaml_contents = dedent(
+    yaml_contents = _PLANET_MOON_MATRIX + dedent(
         """
-        matrix:
-          planet:
-          - mercury
-          - venus
-
-          moon:
-          - europa
-          - ganymede
-
         planet-venus:moon-europa:exclude: yes
         """
     )
@@ -174,17 +217,8 @@ def testExclude():
     ]
 
     # Exclude everything ---------------------------------------------------------------------------
-    yaml_contents = dedent(
+    yaml_contents = _PLANET_MOON_MATRIX + dedent(
         """
-        matrix:
-          planet:
-          - mercury
-          - venus
-
-          moon:
-          - europa
-          - ganymede
-
         exclude: yes
         """
     )
@@ -221,7 +255,7 @@ def testBranchFlags():
 
 
 def testMatrixAndFlags():
-    yaml_contents = dedent(
+    yaml_contents = _PLATFORM_MATRIX + dedent(
         """
         platform-windows:junit_patterns:
         - "junit*.xml"
@@ -231,11 +265,6 @@ def testMatrixAndFlags():
 
         platform-windows:build_batch_commands:
         - "{platform} command"
-
-        matrix:
-            platform:
-            - linux
-            - windows
         """
     )
     for jd_file in JobsDoneJob.CreateFromYAML(yaml_contents, repository=_REPOSITORY):
@@ -250,18 +279,13 @@ def testMatrixAndFlags():
 
 
 def testMatrixAndRegexFlags():
-    yaml_contents = dedent(
+    yaml_contents = _PLATFORM_MATRIX + dedent(
         """
         platform-win.*:junit_patterns:
         - "junit*.xml"
 
         platform-(?!windows):build_shell_commands:
         - "{platform} command"
-
-        matrix:
-            platform:
-            - linux
-            - windows
         """
     )
     for jd_file in JobsDoneJob.CreateFromYAML(yaml_contents, repository=_REPOSITORY):
@@ -305,7 +329,7 @@ def testMatrixAndExtraFlags():
 
 
 def testMatrixAndFlagsForSubDicts():
-    yaml_contents = dedent(
+    yaml_contents = _PLATFORM_MATRIX + dedent(
         """
         git:
           platform-windows:shallow: true
@@ -315,11 +339,6 @@ def testMatrixAndFlagsForSubDicts():
         - git:
               platform-windows:shallow: true
               platform-linux:shallow: false
-
-        matrix:
-            platform:
-            - linux
-            - windows
         """
     )
     for jd_file in JobsDoneJob.CreateFromYAML(yaml_contents, repository=_REPOSITORY):
@@ -364,17 +383,8 @@ def testRaiseWithAmbiguousConditionsAndDifferentValues():
 
     They are not ambiguous as only one will match for every matrix combination.
     """
-    yaml_contents = dedent(
+    yaml_contents = _PLATFORM_SLAVE_MATRIX + dedent(
         """
-        matrix:
-            platform:
-            - linux
-            - windows
-
-            slave:
-            - slave1
-            - slave2
-
         platform-linux:display_name: "Linux job"
         slave-slave2:display_name: "slave2 job"
         """
@@ -391,17 +401,8 @@ def testIgnoreAmbiguousConditionsWithEqualValues():
     should ignore when the value does not change. This is very useful when you have a large matrix
     and need to set the same value for a lot of them.
     """
-    yaml_contents = dedent(
+    yaml_contents = _PLATFORM_SLAVE_MATRIX + dedent(
         """
-        matrix:
-            platform:
-            - linux
-            - windows
-
-            slave:
-            - slave1
-            - slave2
-
         platform-linux:display_name: "Foo job"
         slave-slave2:display_name: "Foo job"
         """
@@ -417,17 +418,8 @@ def testAllowOverridingConditions():
     """
     ..see: `testRaiseWithAmbiguousConditionsAndDifferentValues` for more details
     """
-    yaml_contents = dedent(
+    yaml_contents = _PLATFORM_SLAVE_MATRIX + dedent(
         """
-        matrix:
-            platform:
-            - linux
-            - windows
-
-            slave:
-            - slave1
-            - slave2
-
         display_name: "Generic job"
         platform-linux:display_name: "Linux job"
         platform-linux:slave-slave2:display_name: "slave2 job"
@@ -444,16 +436,7 @@ def testAllowOverridingConditions():
 
 
 def testBranchPatterns():
-    base_contents = dedent(
-        """
-        matrix:
-            planet:
-            - mars
-            - earth
-            - venus
-
-        """
-    )
+    base_contents = _PLANETS_MATRIX
     # Using a pattern that does not match our branch will prevent jobs from being generated
     jd_file_contents = base_contents + dedent(
         """
@@ -502,6 +485,60 @@ def testBranchPatterns():
     jobs = JobsDoneJob.CreateFromYAML(jd_file_contents, repository=_REPOSITORY)
     assert len(jobs) == 2
 
+    # Conditional patterns take precedence over a pattern that does not match our branch
+    jd_file_contents = base_contents + dedent(
+        """
+        branch_patterns:
+        - master
+
+        planet-mars:branch_patterns:
+        - milky.*
+        """
+    )
+    jobs = JobsDoneJob.CreateFromYAML(jd_file_contents, repository=_REPOSITORY)
+    assert [job.matrix_row for job in jobs] == [{"planet": "mars"}]
+
+    # Patterns are formatted like any other option
+    jd_file_contents = base_contents + dedent(
+        """
+        branch_patterns:
+        - "{branch}"
+        """
+    )
+    jobs = JobsDoneJob.CreateFromYAML(jd_file_contents, repository=_REPOSITORY)
+    assert len(jobs) == 3
+
+
+def testBranchPatternsDoNotHideErrors():
+    """
+    Errors in a jobs_done file are still raised when its branch patterns do not match our branch.
+    """
+    # Unknown replacement variable
+    yaml_contents = _PLATFORM_MATRIX + dedent(
+        """
+        branch_patterns:
+        - master
+
+        build_shell_commands:
+        - "{platfrom} command"
+        """
+    )
+    with pytest.raises(KeyError):
+        JobsDoneJob.CreateFromYAML(yaml_contents, repository=_REPOSITORY)
+
+    # Ambiguous conditions
+    yaml_contents = _PLATFORM_SLAVE_MATRIX + dedent(
+        """
+        branch_patterns:
+        - master
+
+        platform-linux:display_name: "Linux job"
+        slave-slave2:display_name: "slave2 job"
+        """
+    )
+    with pytest.raises(ValueError, match="ambiguous conditions"):
+        JobsDoneJob.CreateFromYAML(yaml_contents, repository=_REPOSITORY)
+
 
 def testUnknownOption():
     # Unknown options should fail
@@ -536,22 +573,13 @@ def testTypeChecking():
         JobsDoneJob.CreateFromYAML(yaml_contents, repository=_REPOSITORY)
 
     assert e.value.option_name == "build_batch_commands"
-    assert e.value.accepted_types == [JobsDoneJob.PARSEABLE_OPTIONS["build_batch_commands"]]
+    assert e.value.accepted_types == (JobsDoneJob.PARSEABLE_OPTIONS["build_batch_commands"],)
     assert e.value.obtained_type == str
     assert e.value.option_value == "string item"
 
 
 def testCreateFromFile(tmpdir):
-    contents = dedent(
-        """
-        matrix:
-            planet:
-            - mars
-            - earth
-            - venus
-
-        """
-    )
+    contents = _PLANETS_MATRIX
     f = tmpdir / ".jobs_done.yaml"
     f.write(contents)
 
@@ -581,16 +609,12 @@ def testIgnoreUnmatchable():
     Asserts that using a condition that can never be matched will not raise an error if
     'ignore_unmatchable' is enabled.
     """
-    contents = dedent(
+    contents = _EARTH_MATRIX + dedent(
         """
         ignore_unmatchable: true
 
         planet-pluto:junit_patterns:
             - '*.xml'
-
-        matrix:
-            planet:
-            - earth
         """
     )
     JobsDoneJob.CreateFromYAML(contents, repository=_REPOSITORY)
@@ -600,14 +624,10 @@ def testUnmatchableCondition():
     """
     Asserts that using a condition that can never be matched will raise an error.
     """
-    contents = dedent(
+    contents = _EARTH_MATRIX + dedent(
         """
         planet-pluto:junit_patterns:
             - '*.xml'
-
-        matrix:
-            planet:
-            - earth
         """
     )
     with pytest.raises(UnmatchableConditionError) as e:
@@ -617,29 +637,21 @@ def testUnmatchableCondition():
 
 
 def testUnmatchableSubCondition():
-    contents = dedent(
+    contents = _EARTH_MATRIX + dedent(
         """
         git:
             planet-pluto:shallow: true
-
-        matrix:
-            planet:
-            - earth
         """
     )
     with pytest.raises(UnmatchableConditionError) as e:
         JobsDoneJob.CreateFromYAML(contents, repository=_REPOSITORY)
     assert e.value.option == "planet-pluto:shallow"
 
-    contents = dedent(
+    contents = _EARTH_MATRIX + dedent(
         """
         additional_repositories:
         - git:
             planet-pluto:shallow: true
-
-        matrix:
-            planet:
-            - earth
         """
     )
     with pytest.raises(UnmatchableConditionError) as e:
@@ -659,3 +671,43 @@ def testStripFile():
     )
     contents += "\t"
     JobsDoneJob.CreateFromYAML(contents, repository=_REPOSITORY)
+
+
+def testEmptyFile():
+    with pytest.raises(ValueError, match="Could not parse anything"):
+        JobsDoneJob.CreateFromYAML(" \t\n", repository=_REPOSITORY)
+
+
+def testYAMLSyntaxError():
+    """
+    Syntax errors point to the offending line and character, as users need them to fix their files.
+    """
+    contents = dedent(
+        """
+        junit_patterns:
+        - `junit*.xml`
+        """
+    )
+    with pytest.raises(yaml.YAMLError) as e:
+        JobsDoneJob.CreateFromYAML(contents, repository=_REPOSITORY)
+
+    assert "found character '`' that cannot start any token" in str(e.value)
+    assert "- `junit*.xml`\n      ^" in str(e.value)
+
+
+def testCreateFromYAMLTwice():
+    """
+    Parsing the same contents more than once must create independent jobs, as generators are free
+    to change the options they receive.
+    """
+    contents = _EARTH_MATRIX + dedent(
+        """
+        git:
+          tags: true
+        """
+    )
+    (job,) = JobsDoneJob.CreateFromYAML(contents, repository=_REPOSITORY)
+    job.git.pop("tags")
+
+    (job,) = JobsDoneJob.CreateFromYAML(contents, repository=_REPOSITORY)
+    assert job.git == {"tags": "true"}
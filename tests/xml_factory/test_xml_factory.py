@@ -247,6 +247,24 @@ class Test:
             </root>"""
         )
 
+    def testPrettyXMLToFilename(self, input_xml, tmp_path) -> None:
+        iss = StringIO(input_xml)
+        obtained_filename = tmp_path / "pretty.obtained.xml"
+
+        WritePrettyXML(iss, str(obtained_filename))
+        assert obtained_filename.read_text(encoding="utf-8") == dedent(
+            """\
+            <root>
+              <alpha enabled="true">
+                <bravo>
+                  <charlie/>
+                </bravo>
+                <bravo.one/>
+                <delta>XXX</delta>
+              </alpha>
+            </root>"""
+        )
+
     def testEscape(self) -> None:
         element = ElementTree.Element("root")
         element.attrib["name"] = "<no>"